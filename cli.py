@@ -5,6 +5,7 @@ This module provides a CLI tool for generating EDA reports from CSV files.
 """
 
 import argparse
+import logging
 import sys
 import pandas as pd
 from pathlib import Path
@@ -144,6 +145,17 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
     
+    # Report generation progress is logged; show it only in verbose mode.
+    # Only the package logger is configured so third-party INFO stays quiet,
+    # and the CLI owns its output, so records do not propagate to the root.
+    package_logger = logging.getLogger("shaheenviz")
+    if not package_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        package_logger.addHandler(handler)
+    package_logger.propagate = False
+    package_logger.setLevel(logging.INFO if args.verbose else logging.WARNING)
+    
     # Display system info if requested
     if args.system_info:
         print("System Information:")
@@ -5,222 +5,121 @@ This module manages EDA mode selection and report generation, choosing between
 YData Profiling and Sweetviz based on dataset characteristics.
 """
 
+import os
+import re
+import logging
+import mmap
+import shutil
+import tempfile
 import pandas as pd
 import numpy as np
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, Iterator
+from functools import lru_cache
 import warnings
 from tqdm import tqdm
 
-# Fix matplotlib backend to prevent threading issues
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-
 from .profiling_wrapper import ProfileWrapper
 from .sweetviz_wrapper import SweetvizWrapper
 from .utils import detect_target, save_reports
 
+logger = logging.getLogger(__name__)
 
-class ShaheenvizReport:
-    """
-    Main report class that wraps either YData Profiling or Sweetviz reports.
-    """
+
+# Branding replacement mappings applied to generated HTML reports. Keys are
+# matched in a single left-to-right pass: the leftmost match wins, and among
+# keys starting at the same offset the longest one wins. A key that starts
+# earlier therefore shadows an overlapping key, so context-only prefixes such
+# as '<h1>YData' must not be added (they would split 'YData Profiling'), and
+# phrases a shorter key already rewrites identically (e.g. 'sweetviz-',
+# 'Sweetviz Report') are left out.
+_BRAND_MAP = {
+    # Primary branding replacements (YData Profiling)
+    'ydata-profiling': 'shaheenviz',
+    'YData Profiling': 'Shaheenviz',
+    'ydata_profiling': 'shaheenviz',
+    'YData': 'Shaheenviz',
+    'ydata': 'shaheenviz',
     
-    def __init__(self, backend_report, backend_type: str, metadata: Dict[str, Any]):
-        """
-        Initialize the unified report.
-        
-        Args:
-            backend_report: The underlying report object (ProfileReport or SweetvizReport)
-            backend_type: Either 'ydata' or 'sweetviz'
-            metadata: Additional metadata about the report generation
-        """
-        self.backend_report = backend_report
-        self.backend_type = backend_type
-        self.metadata = metadata
+    # Sweetviz branding replacements
+    'sweetviz': 'shaheenviz',
+    'Sweetviz': 'Shaheenviz',
+    'SweetViz': 'Shaheenviz',
+    'SweetVIZ': 'Shaheenviz',
+    'SWEETVIZ': 'SHAHEENVIZ',
     
-    def save_html(self, filepath: str, **kwargs) -> None:
-        """Save report as HTML file with custom Shaheenviz branding."""
-        if self.backend_type == 'ydata':
-            self.backend_report.to_file(filepath, **kwargs)
-            # Post-process the HTML file to customize branding
-            self._customize_html_file(filepath)
-        elif self.backend_type == 'sweetviz':
-            # Sweetviz uses show_html for saving files
-            layout = kwargs.pop('layout', 'widescreen')
-            scale = kwargs.pop('scale', 1.0)
-            self.backend_report.show_html(filepath, layout=layout, scale=scale, **kwargs)
-            # Post-process the HTML file to customize branding
-            self._customize_html_file(filepath)
+    # Sweetviz version replacement
+    '2.3.1': 'v1.0.0',
     
-    def save_json(self, filepath: str) -> None:
-        """Save report as JSON file (YData Profiling only)."""
-        if self.backend_type == 'ydata':
-            self.backend_report.to_file(filepath)
-        else:
-            warnings.warn("JSON export is only supported for YData Profiling backend")
+    # Sweetviz specific links and references
+    'fbdesignpro/sweetviz': 'hamza-0987/shaheenviz',
+    'fbdesignpro/shaheenviz': 'hamza-0987/shaheenviz',
+    'https://www.fbdesignpro.com': 'https://github.com/hamza-0987/shaheenviz',
+    'fbdesignpro.com': 'github.com/hamza-0987/shaheenviz',
+    'Francois Bertrand': 'Hamza',
+    'Jean-Francois Hains': 'Shaheenviz Team',
+    'Graphic design by': 'Developed by',
     
-    def show_notebook(self, **kwargs):
-        """Display report in Jupyter notebook."""
-        if self.backend_type == 'ydata':
-            return self.backend_report.to_notebook_iframe(**kwargs)
-        elif self.backend_type == 'sweetviz':
-            return self.backend_report.show_notebook(**kwargs)
+    # Meta tag replacements
+    'content="YData Profiling"': 'content="Shaheenviz EDA Report"',
+    'content="Sweetviz"': 'content="Shaheenviz EDA Report"',
     
-    def get_rejected_variables(self) -> list:
-        """Get list of rejected variables (YData Profiling only)."""
-        if self.backend_type == 'ydata':
-            return self.backend_report.get_rejected_variables()
-        else:
-            warnings.warn("Rejected variables info is only available for YData Profiling backend")
-            return []
+    # Author replacements
+    'author" content="YData Profiling"': 'author" content="Shaheenviz"',
+    'author" content="Sweetviz': 'author" content="Shaheenviz',
     
-    def _customize_html_file(self, filepath: str) -> None:
-        """
-        Post-process HTML file to replace YData branding with Shaheenviz branding.
-        
-        Args:
-            filepath: Path to the HTML file to customize
-        """
-        try:
-            print(f"🔧 Starting HTML customization for: {filepath}")
-            
-            # Read the HTML file
-            with open(filepath, 'r', encoding='utf-8') as file:
-                html_content = file.read()
-            
-            print(f"📄 Original HTML size: {len(html_content)} characters")
-            
-            # Apply branding customizations
-            customized_content = self._apply_branding_replacements(html_content)
-            
-            print(f"📄 Customized HTML size: {len(customized_content)} characters")
-            
-            # Write the customized content back to the file
-            with open(filepath, 'w', encoding='utf-8') as file:
-                file.write(customized_content)
-            
-            print(f"✅ HTML customization completed for: {filepath}")
-                
-        except Exception as e:
-            print(f"❌ Failed to customize HTML branding: {str(e)}")
-            warnings.warn(f"Failed to customize HTML branding: {str(e)}")
+    # Link and reference replacements (YData)
+    'github.com/ydataai/ydata-profiling': 'github.com/hamza-0987/shaheenviz',
     
-    def _apply_branding_replacements(self, html_content: str) -> str:
-        """
-        Apply comprehensive branding replacements to HTML content.
-        
-        Args:
-            html_content: Original HTML content
-            
-        Returns:
-            HTML content with Shaheenviz branding
-        """
-        # Define replacement mappings
-        replacements = {
-            # Primary branding replacements (YData Profiling)
-            'ydata-profiling': 'shaheenviz',
-            'YData Profiling': 'Shaheenviz',
-            'ydata_profiling': 'shaheenviz',
-            'YData': 'Shaheenviz',
-            'ydata': 'shaheenviz',
-            
-            # Sweetviz branding replacements
-            'sweetviz': 'shaheenviz',
-            'Sweetviz': 'Shaheenviz',
-            'SweetViz': 'Shaheenviz',
-            'SweetVIZ': 'Shaheenviz',
-            'SWEETVIZ': 'SHAHEENVIZ',
-            
-            # Exact Sweetviz logo and version replacements
-            'SweetViz\n                2.3.1': 'Shaheenviz\n                v1.0.0',
-            'SweetViz 2.3.1': 'Shaheenviz v1.0.0',
-            '2.3.1': 'v1.0.0',
-            
-            # Sweetviz specific links and references
-            'https://github.com/fbdesignpro/sweetviz': 'https://github.com/hamza-0987/shaheenviz',
-            'https://github.com/fbdesignpro/shaheenviz': 'https://github.com/hamza-0987/shaheenviz',
-            'github.com/fbdesignpro/sweetviz': 'github.com/hamza-0987/shaheenviz',
-            'github.com/fbdesignpro/shaheenviz': 'github.com/hamza-0987/shaheenviz',
-            'fbdesignpro/sweetviz': 'hamza-0987/shaheenviz',
-            'fbdesignpro/shaheenviz': 'hamza-0987/shaheenviz',
-            'https://www.fbdesignpro.com': 'https://github.com/hamza-0987/shaheenviz',
-            'fbdesignpro.com': 'github.com/hamza-0987/shaheenviz',
-            'Francois Bertrand': 'Hamza',
-            'Jean-Francois Hains': 'Shaheenviz Team',
-            'Created & maintained by Francois Bertrand': 'Created & maintained by Hamza',
-            'Created & maintained by': 'Created & maintained by',
-            'Graphic design by Jean-Francois Hains': 'Developed by Shaheenviz Team',
-            'Graphic design by': 'Developed by',
-            'Get updates, docs & report issues here': 'Get updates, docs & report issues here',
-            
-            # Sweetviz titles and headers
-            '<title>Sweetviz': '<title>Shaheenviz',
-            'Sweetviz Report': 'Shaheenviz Report',
-            'Generated by Sweetviz': 'Generated by Shaheenviz',
-            'Powered by Sweetviz': 'Powered by Shaheenviz',
-            
-            # Meta tag replacements
-            'content="ydata-profiling"': 'content="shaheenviz"',
-            'content="YData Profiling"': 'content="Shaheenviz EDA Report"',
-            'content="sweetviz"': 'content="shaheenviz"',
-            'content="Sweetviz"': 'content="Shaheenviz EDA Report"',
-            'name="ydata-profiling"': 'name="shaheenviz"',
-            'name="sweetviz"': 'name="shaheenviz"',
-            
-            # Generator and author replacements
-            'generator" content="ydata-profiling': 'generator" content="shaheenviz',
-            'generator" content="sweetviz': 'generator" content="shaheenviz',
-            'author" content="YData': 'author" content="Shaheenviz',
-            'author" content="Sweetviz': 'author" content="Shaheenviz',
-            
-            # Link and reference replacements (YData)
-            'https://github.com/ydataai/ydata-profiling': 'https://github.com/hamza-0987/shaheenviz',
-            'github.com/ydataai/ydata-profiling': 'github.com/hamza-0987/shaheenviz',
-            
-            # Copyright and footer replacements
-            '© YData': '© Shaheenviz',
-            'YData Inc.': 'Shaheenviz',
-            'ydata.ai': 'shaheenviz.dev',
-            
-            # Title and heading replacements
-            '<title>YData': '<title>Shaheenviz',
-            '<h1>YData': '<h1>Shaheenviz',
-            '<h2>YData': '<h2>Shaheenviz',
-            '<h1>Sweetviz': '<h1>Shaheenviz',
-            '<h2>Sweetviz': '<h2>Shaheenviz',
-            
-            # CSS class and ID replacements (be careful not to break functionality)
-            'ydata-': 'shaheenviz-',
-            'sweetviz-': 'shaheenviz-',
-            
-            # JavaScript variable replacements
-            'var ydata': 'var shaheenviz',
-            'var sweetviz': 'var shaheenviz',
-            'window.ydata': 'window.shaheenviz',
-            'window.sweetviz': 'window.shaheenviz',
-            
-            # Description and metadata replacements
-            'profiling report generated using ydata-profiling': 'profiling report generated using shaheenviz',
-            'report generated using sweetviz': 'report generated using shaheenviz',
-            'Generated by ydata-profiling': 'Generated by Shaheenviz',
-            'Generated by sweetviz': 'Generated by Shaheenviz',
-            'Powered by ydata-profiling': 'Powered by Shaheenviz',
-            'Powered by sweetviz': 'Powered by Shaheenviz',
-            
-            # Version and package name replacements
-            'ydata-profiling v': 'shaheenviz v',
-            'sweetviz v': 'shaheenviz v',
-            'package: ydata-profiling': 'package: shaheenviz',
-            'package: sweetviz': 'package: shaheenviz',
-        }
-        
-        # Apply all replacements
-        customized_content = html_content
-        for old_text, new_text in replacements.items():
-            customized_content = customized_content.replace(old_text, new_text)
-        
-        # Add Tailwind CSS and Shadcn styles along with logo linking
-        head_insertion = '''
+    # Copyright and footer replacements
+    'YData Inc.': 'Shaheenviz',
+    'ydata.ai': 'shaheenviz.dev',
+    
+    # Description and metadata replacements
+    'Generated by ydata-profiling': 'Generated by Shaheenviz',
+    'Generated by sweetviz': 'Generated by Shaheenviz',
+    'Powered by ydata-profiling': 'Powered by Shaheenviz',
+    'Powered by sweetviz': 'Powered by Shaheenviz',
+}
+
+
+def _build_trie_pattern(keys) -> str:
+    """
+    Build a regex pattern matching any of the given literal keys.
+    
+    The keys are folded into a prefix trie so the regex engine follows a
+    single path per position instead of trying every alternative in turn.
+    Longer continuations are tried before ending a match, so the longest key
+    at each position wins.
+    
+    Args:
+        keys: Iterable of literal strings to match
+    
+    Returns:
+        Regex pattern string
+    """
+    trie = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def _to_pattern(node) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + _to_pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        pattern = '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if terminal else pattern
+    
+    return _to_pattern(trie)
+
+
+# Tailwind CSS and Shadcn styles inserted after <head>
+_HEAD_INSERTION = b'''
     <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
     <link href="https://cdn.jsdelivr.net/npm/shadcn@0.x.x/dist/shadcn.min.css" rel="stylesheet">  <!-- Replace with actual version -->
     <style>
@@ -335,7 +234,9 @@ class ShaheenvizReport:
         .sv-header { background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%) !important; }
     </style>
     '''
-        header_content = '''
+
+# Logo header linking to the project, inserted after <body>
+_HEADER_CONTENT = b'''
     <div class="shaheenviz-header">
         <div class="shaheenviz-container">
             <a href="https://github.com/hamza-0987/shaheenviz" class="shaheenviz-logo">
@@ -344,10 +245,245 @@ class ShaheenvizReport:
         </div>
     </div>
     '''
-        customized_content = customized_content.replace('<head>', '<head>' + head_insertion)
-        customized_content = customized_content.replace('<body>', '<body>' + header_content)
+
+
+# Tags after which the Shaheenviz styles and header are injected
+_INJECTIONS = {b'<head>': _HEAD_INSERTION, b'<body>': _HEADER_CONTENT}
+
+
+def _compile_branding(keys) -> re.Pattern:
+    """
+    Compile a bytes regex matching the given branding keys and injection tags.
+    
+    The longest key at each position wins so that specific phrases
+    (e.g. 'Powered by sweetviz') beat their fragments.
+    
+    Args:
+        keys: Iterable of branding keys from _BRAND_MAP
+    
+    Returns:
+        Compiled bytes pattern
+    """
+    tags = [tag.decode('utf-8') for tag in _INJECTIONS]
+    return re.compile(_build_trie_pattern([*keys, *tags]).encode('utf-8'))
+
+
+_BRAND_BYTES = {old.encode('utf-8'): new.encode('utf-8') for old, new in _BRAND_MAP.items()}
+
+
+@lru_cache(maxsize=None)
+def _branding_pattern(backend: Optional[str]) -> re.Pattern:
+    """
+    Compile, on first use, the branding pattern for a backend's reports.
+    
+    Keys naming one backend only need to be matched in that backend's
+    reports; keys naming neither backend are shared. ``None`` selects the
+    pattern matching only the injection tags, and an unknown backend
+    matches every key.
+    
+    Args:
+        backend: 'ydata', 'sweetviz', another backend name, or None
+    
+    Returns:
+        Compiled bytes pattern
+    """
+    if backend is None:
+        return _compile_branding([])
+    if backend not in ('ydata', 'sweetviz'):
+        return _compile_branding(_BRAND_MAP)
+    return _compile_branding([
+        key for key in _BRAND_MAP
+        if backend in key.lower()
+        or ('ydata' not in key.lower() and 'sweetviz' not in key.lower())
+    ])
+
+
+# Exact-case backend names used by _BRAND_MAP. Output containing none of them
+# only needs the injections; plain substring searches keep the miss cheap.
+_BRAND_PROBES = (b'ydata', b'YData', b'sweetviz', b'Sweetviz', b'SweetViz', b'SweetVIZ', b'SWEETVIZ')
+
+
+class ShaheenvizReport:
+    """
+    Main report class that wraps either YData Profiling or Sweetviz reports.
+    """
+    
+    __slots__ = ('backend_report', 'backend_type', 'metadata')
+    
+    def __init__(self, backend_report, backend_type: str, metadata: Dict[str, Any]):
+        """
+        Initialize the unified report.
+        
+        Args:
+            backend_report: The underlying report object (ProfileReport or SweetvizReport)
+            backend_type: Either 'ydata' or 'sweetviz'
+            metadata: Additional metadata about the report generation
+        """
+        self.backend_report = backend_report
+        self.backend_type = backend_type
+        self.metadata = metadata
+    
+    def save_html(self, filepath: str, **kwargs) -> None:
+        """Save report as HTML file with custom Shaheenviz branding."""
+        if self.backend_type == 'ydata':
+            self.backend_report.to_file(filepath, **kwargs)
+        elif self.backend_type == 'sweetviz':
+            # Sweetviz uses show_html for saving files
+            layout = kwargs.pop('layout', 'widescreen')
+            scale = kwargs.pop('scale', 1.0)
+            self.backend_report.show_html(filepath, layout=layout, scale=scale, **kwargs)
+        else:
+            return
+        
+        # Post-process the HTML file to customize branding, unless the backend
+        # templates were already patched to emit Shaheenviz branding
+        if not self.metadata.get('branding_preinstalled', False):
+            self._customize_html_file(filepath)
+    
+    def save_json(self, filepath: str) -> None:
+        """Save report as JSON file (YData Profiling only)."""
+        if self.backend_type == 'ydata':
+            self.backend_report.to_file(filepath)
+        else:
+            warnings.warn("JSON export is only supported for YData Profiling backend")
+    
+    def show_notebook(self, **kwargs):
+        """Display report in Jupyter notebook."""
+        if self.backend_type == 'ydata':
+            return self.backend_report.to_notebook_iframe(**kwargs)
+        elif self.backend_type == 'sweetviz':
+            return self.backend_report.show_notebook(**kwargs)
+    
+    def get_rejected_variables(self) -> list:
+        """Get list of rejected variables (YData Profiling only)."""
+        if self.backend_type == 'ydata':
+            return self.backend_report.get_rejected_variables()
+        else:
+            warnings.warn("Rejected variables info is only available for YData Profiling backend")
+            return []
+    
+    def _customize_html_file(self, filepath: str) -> None:
+        """
+        Post-process HTML file to replace YData branding with Shaheenviz branding.
+        
+        The file is memory-mapped and the branded output is streamed to a
+        temporary file that atomically replaces the original (or is copied
+        back over it when its directory is not writable). Unchanged spans
+        are written as views into the mapping, so no copy of the report is
+        built in memory.
         
-        return customized_content
+        Args:
+            filepath: Path to the HTML file to customize
+        """
+        temp_path = None
+        try:
+            logger.debug("Starting HTML customization for: %s", filepath)
+            
+            if os.path.getsize(filepath) == 0:
+                # Nothing to brand, and empty files cannot be memory-mapped
+                return
+            
+            # Resolve symlinks so the link target is updated, not replaced
+            real_path = os.path.realpath(filepath)
+            
+            # Stage the branded content next to the original so it can be
+            # swapped in atomically; fall back to the system temp directory
+            # (and a copy back) when that directory is not writable
+            try:
+                target = tempfile.NamedTemporaryFile(
+                    'wb', dir=os.path.dirname(real_path), suffix='.html', delete=False)
+                copy_back = False
+            except OSError:
+                target = tempfile.NamedTemporaryFile('wb', suffix='.html', delete=False)
+                copy_back = True
+            temp_path = target.name
+            
+            with open(real_path, 'rb') as source, target:
+                with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as html_content:
+                    logger.debug("Original HTML size: %d bytes", len(html_content))
+                    
+                    # Apply branding customizations
+                    chunks = self._apply_branding_replacements(html_content)
+                    try:
+                        target.writelines(chunks)
+                    finally:
+                        # Release the views into the mapping before it is closed
+                        chunks.close()
+                
+                logger.debug("Customized HTML size: %d bytes", target.tell())
+            
+            # Replace the original file with the customized content
+            if copy_back:
+                with open(temp_path, 'rb') as staged, open(real_path, 'wb') as file:
+                    shutil.copyfileobj(staged, file)
+            else:
+                shutil.copymode(real_path, temp_path)
+                os.replace(temp_path, real_path)
+                temp_path = None
+            
+            logger.debug("HTML customization completed for: %s", filepath)
+                
+        except Exception as e:
+            warnings.warn(f"Failed to customize HTML branding: {str(e)}")
+        
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def _apply_branding_replacements(self, html_content: bytes) -> Iterator[bytes]:
+        """
+        Apply comprehensive branding replacements to HTML content.
+        
+        Args:
+            html_content: Original HTML content as a bytes-like object (e.g. an mmap)
+            
+        Yields:
+            Consecutive chunks of HTML content with Shaheenviz branding;
+            unchanged spans are memoryview slices of ``html_content``
+        """
+        # Apply all replacements in a single pass, injecting the Shaheenviz
+        # styles and header after the first <head> and <body> tags
+        if all(html_content.find(probe) == -1 for probe in _BRAND_PROBES):
+            # Already carries no backend branding (e.g. pre-patched templates)
+            pattern = _branding_pattern(None)
+        else:
+            pattern = _branding_pattern(self.backend_type)
+        pending = dict(_INJECTIONS)
+        position = 0
+        with memoryview(html_content) as view:
+            for match in pattern.finditer(view):
+                text = match.group(0)
+                if text in _INJECTIONS:
+                    if text not in pending:
+                        # Already injected: leave the tag in the unchanged slice
+                        continue
+                    replacement = text + pending.pop(text)
+                else:
+                    replacement = _BRAND_BYTES[text]
+                yield view[position:match.start()]
+                yield replacement
+                position = match.end()
+            yield view[position:]
+
+
+# Whether matplotlib has already been switched to the Agg backend
+_mpl_backend_set = False
+
+
+def _ensure_mpl_backend() -> None:
+    """
+    Fix matplotlib backend to prevent threading issues.
+    
+    matplotlib is imported lazily on first report generation, so importing
+    Shaheenviz does not pay its import cost.
+    """
+    global _mpl_backend_set
+    if _mpl_backend_set:
+        return
+    
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    _mpl_backend_set = True
 
 
 def _choose_backend(df: pd.DataFrame, target: Optional[str] = None, 
@@ -366,16 +502,19 @@ def _choose_backend(df: pd.DataFrame, target: Optional[str] = None,
     if mode in ['ydata', 'sweetviz']:
         return mode
     
-    # Auto mode logic
-    n_rows, n_cols = df.shape
+    # Auto mode logic (len() avoids building the shape tuple)
+    n_rows = len(df)
+    n_cols = len(df.columns)
     
     # Use Sweetviz for smaller datasets (better visualizations, interactive features)
     if n_rows < 5000 and n_cols < 30:
-        print(f"Dataset size ({n_rows} rows, {n_cols} cols) - choosing Sweetviz for better visualizations")
+        logger.info("Dataset size (%d rows, %d cols) - choosing Sweetviz for better visualizations",
+                    n_rows, n_cols)
         return 'sweetviz'
     
     # Use YData Profiling for larger datasets (better performance, more analysis)
-    print(f"Dataset size ({n_rows} rows, {n_cols} cols) - choosing YData Profiling for better performance")
+    logger.info("Dataset size (%d rows, %d cols) - choosing YData Profiling for better performance",
+                n_rows, n_cols)
     return 'ydata'
 
 
@@ -409,15 +548,17 @@ def generate_report(df: pd.DataFrame,
     if df.empty:
         raise ValueError("DataFrame cannot be empty")
     
+    _ensure_mpl_backend()
+    
     # Auto-detect target if not provided
     if target is None:
         target = detect_target(df)
         if target:
-            print(f"Auto-detected target column: {target}")
+            logger.info("Auto-detected target column: %s", target)
     
     # Choose backend
     backend = _choose_backend(df, target, mode)
-    print(f"Using {backend.upper()} backend for analysis...")
+    logger.info("Using %s backend for analysis...", backend.upper())
     
     # Generate metadata
     metadata = {
@@ -467,11 +608,11 @@ def generate_report(df: pd.DataFrame,
         
         except Exception as e:
             pbar.set_description(f"Error generating {backend.upper()} report")
-            print(f"\n⚠️  Error with {backend.upper()} backend: {str(e)}")
+            logger.warning("Error with %s backend: %s", backend.upper(), e)
             
             # Try fallback to the other backend
             fallback_backend = 'ydata' if backend == 'sweetviz' else 'sweetviz'
-            print(f"🔄 Attempting fallback to {fallback_backend.upper()} backend...")
+            logger.warning("Attempting fallback to %s backend...", fallback_backend.upper())
             
             try:
                 if fallback_backend == 'ydata':
@@ -486,7 +627,7 @@ def generate_report(df: pd.DataFrame,
                     backend = 'ydata'  # Update backend variable
                     metadata['backend'] = 'ydata'
                     metadata['fallback_used'] = True
-                    print("✅ Fallback to YData Profiling successful")
+                    logger.info("Fallback to YData Profiling successful")
                 else:
                     wrapper = SweetvizWrapper()
                     report = wrapper.generate_report(
@@ -499,7 +640,7 @@ def generate_report(df: pd.DataFrame,
                     backend = 'sweetviz'  # Update backend variable
                     metadata['backend'] = 'sweetviz'
                     metadata['fallback_used'] = True
-                    print("✅ Fallback to Sweetviz successful")
+                    logger.info("Fallback to Sweetviz successful")
             
             except Exception as fallback_error:
                 raise RuntimeError(
@@ -507,6 +648,10 @@ def generate_report(df: pd.DataFrame,
                     f"Fallback error ({fallback_backend}): {str(fallback_error)}"
                 )
     
+    # Wrappers that patch the backend templates expose this flag so
+    # save_html can skip the HTML post-processing pass
+    metadata['branding_preinstalled'] = getattr(wrapper, 'branding_preinstalled', False)
+    
     return ShaheenvizReport(report, backend, metadata)
 
 
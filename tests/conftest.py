@@ -0,0 +1,25 @@
+"""
+Test configuration for Shaheenviz.
+
+The repository root is the ``shaheenviz`` package itself, so a plain checkout
+is not importable under that name. When the package is not installed, load it
+from the checkout so the tests can run with ``python -m pytest tests`` from the
+repository root.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+if importlib.util.find_spec('shaheenviz') is None:
+    spec = importlib.util.spec_from_file_location(
+        'shaheenviz',
+        PACKAGE_DIR / '__init__.py',
+        submodule_search_locations=[str(PACKAGE_DIR)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['shaheenviz'] = module
+    spec.loader.exec_module(module)
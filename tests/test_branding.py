@@ -0,0 +1,60 @@
+"""
+Tests for the HTML branding post-processing in Shaheenviz reports.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from shaheenviz.core import ShaheenvizReport, _HEAD_INSERTION, _HEADER_CONTENT
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def _brand_bytes(html: bytes, backend: str = 'ydata') -> bytes:
+    """Run the branding pass over raw HTML bytes for the given backend."""
+    report = ShaheenvizReport(None, backend, {})
+    return b''.join(report._apply_branding_replacements(html))
+
+
+def _brand(html: str, backend: str = 'ydata') -> str:
+    """Run the branding pass over an HTML string for the given backend."""
+    return _brand_bytes(html.encode('utf-8'), backend).decode('utf-8')
+
+
+@pytest.mark.parametrize('backend', ['ydata', 'sweetviz'])
+def test_fixture_report_output_is_pinned(backend):
+    # Guards the pruned replacement map: any change to _BRAND_MAP that alters
+    # the branded output of a representative report must update the fixture.
+    html = (FIXTURES / f'{backend}_report.html').read_bytes()
+    expected = (FIXTURES / f'{backend}_report_branded.html').read_bytes()
+    assert _brand_bytes(html, backend) == expected
+
+
+@pytest.mark.parametrize('html, expected', [
+    ('<title>YData Profiling Report</title>', '<title>Shaheenviz Report</title>'),
+    ('<h1>YData Profiling</h1>', '<h1>Shaheenviz</h1>'),
+    ('<h2>YData Profiling</h2>', '<h2>Shaheenviz</h2>'),
+    ('<meta name="author" content="YData Profiling">', '<meta name="author" content="Shaheenviz">'),
+    ('var ydata_profiling = {};', 'var shaheenviz = {};'),
+    ('© YData Profiling', '© Shaheenviz'),
+])
+def test_overlapping_phrases_are_not_split(html, expected):
+    assert _brand(html) == expected
+
+
+def test_run_together_text_after_pruned_identity_entry():
+    # The identity 'Created & maintained by' entry was pruned, so its trailing
+    # 'y' no longer shields run-together text from the 'ydata' key
+    assert _brand('Created & maintained bydata') == 'Created & maintained bshaheenviz'
+
+
+@pytest.mark.parametrize('backend', ['ydata', 'sweetviz'])
+def test_unbranded_output_only_gets_injections(backend):
+    # Without any backend name the branding keys are skipped entirely, so the
+    # shared '2.3.1' key is left alone while the injections still happen
+    html = b'<html><head><title>Report 2.3.1</title></head><body>plain</body></html>'
+    expected = (b'<html><head>' + _HEAD_INSERTION + b'<title>Report 2.3.1</title></head>'
+                b'<body>' + _HEADER_CONTENT + b'plain</body></html>')
+    assert _brand_bytes(html, backend) == expected